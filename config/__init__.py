@@ -1,4 +1,4 @@
 """Configuration package"""
-from .extraction_config import EXTRACTION_CONFIG
+from .extraction_config import EXTRACTION_CONFIG, apply_header_fixes
 
-__all__ = ['EXTRACTION_CONFIG']
+__all__ = ['EXTRACTION_CONFIG', 'apply_header_fixes']
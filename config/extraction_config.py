@@ -2,6 +2,8 @@
 Extraction Configuration
 Centralized configuration for PDF extraction, validation, and confidence scoring
 """
+import re
+from types import MappingProxyType
 
 EXTRACTION_CONFIG = {
     # Confidence thresholds
@@ -32,7 +34,9 @@ EXTRACTION_CONFIG = {
         # Spacing fix patterns (pattern, replacement)
         "spacing_fix_patterns": [
             # Fix EIN with spaces: "3 9 - 0 8 0 6 2 5 1" → "39-0806251"
-            (r'(\d)\s+(\d)\s*-\s*(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)',
+            # [ \t] instead of \s keeps the match on one line and avoids the
+            # backtracking that multi-line whitespace classes cause on misses
+            (r'(\d)[ \t]+(\d)[ \t]*-[ \t]*(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)',
              r'\1\2-\3\4\5\6\7\8\9'),
         ],
 
@@ -87,3 +91,40 @@ EXTRACTION_CONFIG = {
         "text_pattern",      # Fallback: Enhanced regex with context
     ],
 }
+
+# Precompiled versions of the normalization patterns.
+# Compiled once at import time so per-cell normalization (thousands of calls
+# per PDF) reuses the same re.Pattern objects instead of recompiling.
+EXTRACTION_CONFIG["table_normalization"]["artifact_patterns_compiled"] = [
+    re.compile(p) for p in EXTRACTION_CONFIG["table_normalization"]["artifact_patterns"]
+]
+EXTRACTION_CONFIG["table_normalization"]["spacing_fix_patterns_compiled"] = [
+    (re.compile(p), r) for p, r in EXTRACTION_CONFIG["table_normalization"]["spacing_fix_patterns"]
+]
+
+# Frozen set for O(1) "is this field critical?" membership checks
+EXTRACTION_CONFIG["critical_fields_set"] = frozenset(EXTRACTION_CONFIG["critical_fields"])
+
+# Freeze the scoring inputs: the shared ConfidenceScorer reads these from
+# multiple request threads, and a read-only view guarantees no caller can
+# mutate weights mid-flight
+EXTRACTION_CONFIG["confidence_weights"] = MappingProxyType(EXTRACTION_CONFIG["confidence_weights"])
+EXTRACTION_CONFIG["confidence_thresholds"] = MappingProxyType(EXTRACTION_CONFIG["confidence_thresholds"])
+EXTRACTION_CONFIG["critical_fields"] = tuple(EXTRACTION_CONFIG["critical_fields"])
+
+# Column-header fixes fused into one compiled alternation of the literal keys,
+# so every fix is applied in a single scan instead of one str.replace per key.
+_HEADER_FIXES = EXTRACTION_CONFIG["table_normalization"]["header_fixes"]
+_HEADER_FIX_RE = re.compile("|".join(re.escape(k) for k in _HEADER_FIXES))
+
+
+def apply_header_fixes(text: str) -> str:
+    """Apply all configured column-header OCR fixes in one pass."""
+    return _HEADER_FIX_RE.sub(lambda m: _HEADER_FIXES[m.group(0)], text)
+
+
+# All artifact patterns share the same action (remove the match), so they are
+# fused into a single alternation: one pass over the text instead of five.
+EXTRACTION_CONFIG["table_normalization"]["artifact_pattern_combined"] = re.compile(
+    "|".join(f"(?:{p})" for p in EXTRACTION_CONFIG["table_normalization"]["artifact_patterns"])
+)
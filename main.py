@@ -4,16 +4,21 @@ FastAPI application for extracting data from Form 990 PDFs
 """
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+import asyncio
+import hashlib
 import os
-import shutil
-import uuid
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
 from datetime import datetime
 import logging
 
 from models import ExtractionResponse, ExtractionResult, HealthResponse, ExtractionResponseV2
 from services.pdf_processor import PDFProcessor
 from services.field_extractor import FieldExtractor
+from services.field_extractor_hybrid import HybridFieldExtractor
 import aiofiles
 
 # Configure logging
@@ -27,7 +32,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="IRS Form 990 PDF Extractor",
     description="API for extracting financial and organizational data from IRS Form 990 PDFs",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -39,13 +45,86 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# V2 models are declared with defer_build=True so importing models.py in
+# workers/CLIs that never touch them skips the core-schema cost; build the
+# response chain the API actually serves once here.
+ExtractionResponseV2.model_rebuild()
+
 # Initialize services
 pdf_processor = PDFProcessor()
 field_extractor = FieldExtractor()
+hybrid_extractor = HybridFieldExtractor()
+
+# Uploads default to tmpfs: temp files are deleted right after processing, so
+# they never need durability and an in-memory write beats a disk write.
+# Override with UPLOAD_DIR when /dev/shm is unavailable (e.g. non-Linux hosts).
+UPLOAD_DIR = os.environ.get("UPLOAD_DIR", "/dev/shm/form990_uploads")
+Path(UPLOAD_DIR).mkdir(parents=True, exist_ok=True)
+
+# Max PDFs processed concurrently by the batch endpoint
+BATCH_CONCURRENCY = 4
+
+# Upload streaming chunk size (1 MiB) - keeps memory flat for large PDFs
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+# Re-submitted PDFs (retries, dashboards) skip extraction entirely via a
+# small LRU keyed by content hash
+EXTRACT_CACHE_SIZE = 128
+_extract_cache: OrderedDict = OrderedDict()
+_extract_cache_v2: OrderedDict = OrderedDict()
+
+
+def cache_get(cache: OrderedDict, key):
+    """Look up a cached extraction result, refreshing its LRU position."""
+    result = cache.get(key)
+    if result is not None:
+        cache.move_to_end(key)
+    return result
+
+
+def cache_put(cache: OrderedDict, key, result) -> None:
+    """Insert an extraction result, evicting the least recently used entry."""
+    cache[key] = result
+    cache.move_to_end(key)
+    while len(cache) > EXTRACT_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+async def save_upload(file: UploadFile, dest_path: str) -> str:
+    """Persist an uploaded file to disk without blocking the event loop.
+
+    Streams in fixed-size chunks instead of buffering the whole upload,
+    so peak memory stays constant regardless of PDF size. Returns the
+    SHA-256 hex digest of the content, computed while streaming.
+    """
+    digest = hashlib.sha256()
+    async with aiofiles.open(dest_path, 'wb') as buffer:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            await buffer.write(chunk)
+    return digest.hexdigest()
+
+
+def is_pdf_filename(name: str) -> bool:
+    """Check the .pdf extension without lowercasing the whole filename."""
+    return bool(name) and name[-4:].lower() == '.pdf'
+
 
-# Ensure uploads directory exists
-UPLOAD_DIR = os.path.join(os.path.dirname(__file__), "uploads")
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+def allocate_temp_path() -> str:
+    """Reserve a unique temp file path in the uploads directory."""
+    with tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, suffix='.pdf', delete=False) as tf:
+        return tf.name
+
+
+def remove_temp_file(path: str) -> None:
+    """Delete a temp file, tolerating it already being gone (skips the stat probe)."""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Failed to remove temp file: {e}")
 
 
 @app.get("/", response_model=HealthResponse)
@@ -82,37 +161,48 @@ async def extract_form_990(
         ExtractionResponse with extracted fields
     """
     # Validate file type
-    if not file.filename.lower().endswith('.pdf'):
+    if not is_pdf_filename(file.filename):
         raise HTTPException(
             status_code=400,
             detail="Only PDF files are supported"
         )
     
-    # Generate unique filename
-    file_id = str(uuid.uuid4())
-    temp_path = os.path.join(UPLOAD_DIR, f"{file_id}.pdf")
-    
+    temp_path = allocate_temp_path()
+
+
     try:
-        # Save uploaded file
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
+        digest = await save_upload(file, temp_path)
+
+        cache_key = (digest, force_ocr)
+        cached = cache_get(_extract_cache, cache_key)
+        if cached is not None:
+            logger.info(f"Cache hit for {file.filename}")
+            result = cached.model_copy(update={"filename": file.filename})
+            return ExtractionResponse(
+                success=True,
+                message=f"Successfully extracted data from {file.filename}",
+                data=result
+            )
+
         logger.info(f"Processing file: {file.filename}")
-        
-        # Process PDF
-        full_text, pages_data, extraction_method = pdf_processor.process_pdf(
-            temp_path, 
+
+        # Process PDF (CPU/IO-bound; run in threadpool to keep the event loop free)
+        full_text, pages_data, extraction_method = await run_in_threadpool(
+            pdf_processor.process_pdf,
+            temp_path,
             force_ocr=force_ocr
         )
-        
+
         # Extract fields
-        result = field_extractor.extract_all_fields(
-            full_text, 
-            pages_data, 
+        result = await run_in_threadpool(
+            field_extractor.extract_all_fields,
+            full_text,
+            pages_data,
             file.filename
         )
         result.extraction_method = extraction_method
-        
+        cache_put(_extract_cache, cache_key, result)
+
         logger.info(f"Successfully extracted data from {file.filename}")
         
         return ExtractionResponse(
@@ -137,19 +227,15 @@ async def extract_form_990(
         )
         
     finally:
-        # Clean up temp file
-        if os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except Exception as e:
-                logger.warning(f"Failed to remove temp file: {e}")
+        remove_temp_file(temp_path)
 
 
 @app.post("/api/extract/v2", response_model=ExtractionResponseV2)
 async def extract_form_990_v2(
     file: UploadFile = File(...),
     confidence_threshold: float = 0.7,
-    fail_fast: bool = True
+    fail_fast: bool = True,
+    include_raw: bool = False
 ):
     """
     Enhanced Form 990 extraction with confidence scoring (V2)
@@ -166,11 +252,12 @@ async def extract_form_990_v2(
         file: PDF file to process
         confidence_threshold: Minimum confidence score (0.0-1.0, default 0.7)
         fail_fast: If True, reject extractions below threshold
+        include_raw: If True, include raw extracted text in the result
 
     Returns:
         ExtractionResponseV2 with confidence scores and validation
     """
-    if not file.filename.lower().endswith('.pdf'):
+    if not is_pdf_filename(file.filename):
         return ExtractionResponseV2(
             success=False,
             message="Only PDF files are supported",
@@ -179,15 +266,21 @@ async def extract_form_990_v2(
 
     # Save uploaded file
     filepath = os.path.join(UPLOAD_DIR, file.filename)
-    async with aiofiles.open(filepath, 'wb') as f:
-        content = await file.read()
-        await f.write(content)
+    digest = await save_upload(file, filepath)
 
     try:
-        # Use hybrid extraction (V2 infrastructure + V1 field extraction)
-        from services.field_extractor_hybrid import HybridFieldExtractor
-        extractor = HybridFieldExtractor()
-        result = extractor.extract_all_fields_v2_hybrid(filepath)
+        cached = cache_get(_extract_cache_v2, digest)
+        if cached is not None:
+            logger.info(f"Cache hit for {file.filename}")
+            result = cached.model_copy(update={"filename": file.filename})
+        else:
+            # Use hybrid extraction (V2 infrastructure + V1 field extraction)
+            result = hybrid_extractor.extract_all_fields_v2_hybrid(filepath)
+            cache_put(_extract_cache_v2, digest, result)
+
+        # raw_text is cached in full but only serialized when requested
+        if not include_raw and result.raw_text is not None:
+            result = result.model_copy(update={"raw_text": None})
 
         # Check fail-fast threshold
         if fail_fast and result.overall_confidence < confidence_threshold:
@@ -215,66 +308,71 @@ async def extract_form_990_v2(
             confidence=0.0
         )
     finally:
-        # Clean up temp file
-        if os.path.exists(filepath):
-            try:
-                os.remove(filepath)
-            except Exception as e:
-                logger.warning(f"Failed to remove temp file: {e}")
+        remove_temp_file(filepath)
 
 
 @app.post("/api/extract-batch", response_model=dict)
-async def extract_batch(files: list[UploadFile] = File(...)):
+async def extract_batch(files: list[UploadFile] = File(...), include_raw: bool = False):
     """
     Extract data from multiple Form 990 PDFs
-    
+
     Args:
         files: List of PDF files to process
-        
+        include_raw: If True, include raw extracted text in each result
+
     Returns:
         Dictionary with results for each file
     """
-    results = []
-    
-    for file in files:
+    # Bound concurrency so a large batch doesn't exhaust the threadpool
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+    async def process_one(file: UploadFile) -> dict:
+        if not is_pdf_filename(file.filename):
+            return {
+                "filename": file.filename,
+                "success": False,
+                "error": "Only PDF files are supported"
+            }
+
+        temp_path = allocate_temp_path()
+
         try:
-            # Process each file using the single extraction endpoint logic
-            if not file.filename.lower().endswith('.pdf'):
-                results.append({
-                    "filename": file.filename,
-                    "success": False,
-                    "error": "Only PDF files are supported"
-                })
-                continue
-            
-            file_id = str(uuid.uuid4())
-            temp_path = os.path.join(UPLOAD_DIR, f"{file_id}.pdf")
-            
-            with open(temp_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            
-            full_text, pages_data, extraction_method = pdf_processor.process_pdf(temp_path)
-            result = field_extractor.extract_all_fields(full_text, pages_data, file.filename)
-            result.extraction_method = extraction_method
-            
-            results.append({
+            async with semaphore:
+                await save_upload(file, temp_path)
+
+                full_text, pages_data, extraction_method = await run_in_threadpool(
+                    pdf_processor.process_pdf, temp_path
+                )
+                result = await run_in_threadpool(
+                    field_extractor.extract_all_fields, full_text, pages_data, file.filename
+                )
+                result.extraction_method = extraction_method
+
+            return {
                 "filename": file.filename,
                 "success": True,
-                "data": result.model_dump()
-            })
-            
-            # Clean up
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
-                
+                # raw_text can be the whole document; only serialize it on request
+                "data": result.model_dump(
+                    mode='json',
+                    exclude_none=True,
+                    exclude=None if include_raw else {'raw_text'}
+                )
+            }
+
         except Exception as e:
             logger.error(f"Error processing {file.filename}: {e}")
-            results.append({
+            return {
                 "filename": file.filename,
                 "success": False,
                 "error": str(e)
-            })
-    
+            }
+
+        finally:
+            remove_temp_file(temp_path)
+
+    results = await asyncio.gather(*(process_one(file) for file in files))
+    results = list(results)
+
     return {
         "total_files": len(files),
         "successful": sum(1 for r in results if r.get("success")),
@@ -285,4 +383,14 @@ async def extract_batch(files: list[UploadFile] = File(...)):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop/httptools speed up the event loop and HTTP parsing; multiple
+    # workers give process-level parallelism for the CPU-bound PDF work
+    # (workers > 1 requires the app as an import string)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count()
+    )
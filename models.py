@@ -1,87 +1,137 @@
 """
 Pydantic models for IRS Form 990 PDF Extractor API
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+
+def _parse_monetary(value):
+    """Parse an extracted monetary string ("$1,234,567.") into a Decimal.
+
+    Extraction code hands over raw strings; converting once here means
+    downstream validation can compare numbers directly instead of
+    re-stripping commas on every check. Unparseable values become None.
+    """
+    if value is None or isinstance(value, Decimal):
+        return value
+    if isinstance(value, (int, float)):
+        value = str(value)
+    cleaned = value.strip().replace('$', '').replace(',', '').rstrip('.')
+    if not cleaned:
+        return None
+    try:
+        return Decimal(cleaned)
+    except InvalidOperation:
+        return None
 
 
 class Page1Fields(BaseModel):
     """Fields extracted from Page 1 of Form 990"""
+    model_config = ConfigDict(extra='ignore', validate_assignment=True)
+
     employer_identification_number: Optional[str] = Field(None, description="Item D: EIN")
-    gross_receipts: Optional[str] = Field(None, description="Item G: Gross receipts")
-    total_contributions: Optional[str] = Field(None, description="Row 8 Current Year: Total contributions")
-    total_revenue: Optional[str] = Field(None, description="Row 12 Current Year: Total revenue")
-    grants_and_similar_amounts_paid: Optional[str] = Field(None, description="Row 13 Current Year")
-    salaries_compensation_benefits: Optional[str] = Field(None, description="Row 15 Current Year")
-    professional_fundraising_fees: Optional[str] = Field(None, description="Row 16a Current Year")
-    total_fundraising_expenses: Optional[str] = Field(None, description="Row 16b inset")
-    total_assets: Optional[str] = Field(None, description="Row 20 Current Year")
-    total_liabilities: Optional[str] = Field(None, description="Row 21 Current Year")
-    net_assets_or_fund_balances: Optional[str] = Field(None, description="Row 22 Current Year")
+    gross_receipts: Optional[Decimal] = Field(None, description="Item G: Gross receipts")
+    total_contributions: Optional[Decimal] = Field(None, description="Row 8 Current Year: Total contributions")
+    total_revenue: Optional[Decimal] = Field(None, description="Row 12 Current Year: Total revenue")
+    grants_and_similar_amounts_paid: Optional[Decimal] = Field(None, description="Row 13 Current Year")
+    salaries_compensation_benefits: Optional[Decimal] = Field(None, description="Row 15 Current Year")
+    professional_fundraising_fees: Optional[Decimal] = Field(None, description="Row 16a Current Year")
+    total_fundraising_expenses: Optional[Decimal] = Field(None, description="Row 16b inset")
+    total_assets: Optional[Decimal] = Field(None, description="Row 20 Current Year")
+    total_liabilities: Optional[Decimal] = Field(None, description="Row 21 Current Year")
+    net_assets_or_fund_balances: Optional[Decimal] = Field(None, description="Row 22 Current Year")
+
+    @field_validator(
+        'gross_receipts', 'total_contributions', 'total_revenue',
+        'grants_and_similar_amounts_paid', 'salaries_compensation_benefits',
+        'professional_fundraising_fees', 'total_fundraising_expenses',
+        'total_assets', 'total_liabilities', 'net_assets_or_fund_balances',
+        mode='before')
+    @classmethod
+    def _coerce_monetary(cls, value):
+        return _parse_monetary(value)
 
 
 class PartVIIIFields(BaseModel):
     """Fields extracted from Part VIII - Statement of Revenue"""
-    federated_campaigns: Optional[str] = Field(None, description="Row 1a")
-    membership_dues: Optional[str] = Field(None, description="Row 1b")
-    fundraising_events: Optional[str] = Field(None, description="Row 1c")
-    related_organizations: Optional[str] = Field(None, description="Row 1d")
-    government_grants: Optional[str] = Field(None, description="Row 1e")
-    all_other_contributions: Optional[str] = Field(None, description="Row 1f")
-    noncash_contributions: Optional[str] = Field(None, description="Row 1g")
-    contributions_total: Optional[str] = Field(None, description="Row 1h Column A")
-    program_service_revenue_total: Optional[str] = Field(None, description="Row 2g Column A")
-    investment_income: Optional[str] = Field(None, description="Row 3 Column A")
-    tax_exempt_bond_income: Optional[str] = Field(None, description="Row 4 Column A")
-    royalties: Optional[str] = Field(None, description="Row 5 Column A")
-    gross_rents_real: Optional[str] = Field(None, description="Row 6a Column i")
-    gross_rents_personal: Optional[str] = Field(None, description="Row 6a Column ii")
-    rental_expenses_real: Optional[str] = Field(None, description="Row 6b Column i")
-    rental_expenses_personal: Optional[str] = Field(None, description="Row 6b Column ii")
-    rental_income_real: Optional[str] = Field(None, description="Row 6c Column i")
-    rental_income_personal: Optional[str] = Field(None, description="Row 6c Column ii")
-    net_rental_income: Optional[str] = Field(None, description="Row 6d Column A")
-    gross_sales_securities: Optional[str] = Field(None, description="Row 7a Column i")
-    gross_sales_other: Optional[str] = Field(None, description="Row 7a Column ii")
-    cost_basis_securities: Optional[str] = Field(None, description="Row 7b Column i")
-    cost_basis_other: Optional[str] = Field(None, description="Row 7b Column ii")
-    gain_loss_securities: Optional[str] = Field(None, description="Row 7c Column i")
-    gain_loss_other: Optional[str] = Field(None, description="Row 7c Column ii")
-    net_gain_loss: Optional[str] = Field(None, description="Row 7d Column A")
-    fundraising_gross_income: Optional[str] = Field(None, description="Row 8a inset")
-    fundraising_8a_other: Optional[str] = Field(None, description="Row 8a Column ii")
-    fundraising_direct_expenses: Optional[str] = Field(None, description="Row 8b Column ii")
-    fundraising_net_income: Optional[str] = Field(None, description="Row 8c Column A")
-    gaming_gross_income: Optional[str] = Field(None, description="Row 9a Column ii")
-    gaming_direct_expenses: Optional[str] = Field(None, description="Row 9b Column ii")
-    gaming_net_income: Optional[str] = Field(None, description="Row 9c Column A")
-    inventory_gross_sales: Optional[str] = Field(None, description="Row 10a Column ii")
-    inventory_cost_of_goods: Optional[str] = Field(None, description="Row 10b Column ii")
-    inventory_net_income: Optional[str] = Field(None, description="Row 10c Column A")
-    other_revenue_total: Optional[str] = Field(None, description="Row 11e Column A")
-    total_revenue: Optional[str] = Field(None, description="Row 12 Column A")
+    model_config = ConfigDict(extra='ignore', validate_assignment=True)
+
+    @field_validator('*', mode='before')
+    @classmethod
+    def _coerce_monetary(cls, value):
+        return _parse_monetary(value)
+
+    federated_campaigns: Optional[Decimal] = Field(None, description="Row 1a")
+    membership_dues: Optional[Decimal] = Field(None, description="Row 1b")
+    fundraising_events: Optional[Decimal] = Field(None, description="Row 1c")
+    related_organizations: Optional[Decimal] = Field(None, description="Row 1d")
+    government_grants: Optional[Decimal] = Field(None, description="Row 1e")
+    all_other_contributions: Optional[Decimal] = Field(None, description="Row 1f")
+    noncash_contributions: Optional[Decimal] = Field(None, description="Row 1g")
+    contributions_total: Optional[Decimal] = Field(None, description="Row 1h Column A")
+    program_service_revenue_total: Optional[Decimal] = Field(None, description="Row 2g Column A")
+    investment_income: Optional[Decimal] = Field(None, description="Row 3 Column A")
+    tax_exempt_bond_income: Optional[Decimal] = Field(None, description="Row 4 Column A")
+    royalties: Optional[Decimal] = Field(None, description="Row 5 Column A")
+    gross_rents_real: Optional[Decimal] = Field(None, description="Row 6a Column i")
+    gross_rents_personal: Optional[Decimal] = Field(None, description="Row 6a Column ii")
+    rental_expenses_real: Optional[Decimal] = Field(None, description="Row 6b Column i")
+    rental_expenses_personal: Optional[Decimal] = Field(None, description="Row 6b Column ii")
+    rental_income_real: Optional[Decimal] = Field(None, description="Row 6c Column i")
+    rental_income_personal: Optional[Decimal] = Field(None, description="Row 6c Column ii")
+    net_rental_income: Optional[Decimal] = Field(None, description="Row 6d Column A")
+    gross_sales_securities: Optional[Decimal] = Field(None, description="Row 7a Column i")
+    gross_sales_other: Optional[Decimal] = Field(None, description="Row 7a Column ii")
+    cost_basis_securities: Optional[Decimal] = Field(None, description="Row 7b Column i")
+    cost_basis_other: Optional[Decimal] = Field(None, description="Row 7b Column ii")
+    gain_loss_securities: Optional[Decimal] = Field(None, description="Row 7c Column i")
+    gain_loss_other: Optional[Decimal] = Field(None, description="Row 7c Column ii")
+    net_gain_loss: Optional[Decimal] = Field(None, description="Row 7d Column A")
+    fundraising_gross_income: Optional[Decimal] = Field(None, description="Row 8a inset")
+    fundraising_8a_other: Optional[Decimal] = Field(None, description="Row 8a Column ii")
+    fundraising_direct_expenses: Optional[Decimal] = Field(None, description="Row 8b Column ii")
+    fundraising_net_income: Optional[Decimal] = Field(None, description="Row 8c Column A")
+    gaming_gross_income: Optional[Decimal] = Field(None, description="Row 9a Column ii")
+    gaming_direct_expenses: Optional[Decimal] = Field(None, description="Row 9b Column ii")
+    gaming_net_income: Optional[Decimal] = Field(None, description="Row 9c Column A")
+    inventory_gross_sales: Optional[Decimal] = Field(None, description="Row 10a Column ii")
+    inventory_cost_of_goods: Optional[Decimal] = Field(None, description="Row 10b Column ii")
+    inventory_net_income: Optional[Decimal] = Field(None, description="Row 10c Column A")
+    other_revenue_total: Optional[Decimal] = Field(None, description="Row 11e Column A")
+    total_revenue: Optional[Decimal] = Field(None, description="Row 12 Column A")
 
 
 class PartIXFields(BaseModel):
     """Fields extracted from Part IX - Statement of Functional Expenses"""
-    grants_domestic_organizations: Optional[str] = Field(None, description="Row 1 Column A")
-    professional_fundraising_services: Optional[str] = Field(None, description="Row 11e Column A")
-    affiliate_payments: Optional[str] = Field(None, description="Row 21 Column A")
-    total_functional_expenses_a: Optional[str] = Field(None, description="Row 25 Column A")
-    total_functional_expenses_b: Optional[str] = Field(None, description="Row 25 Column B")
-    total_functional_expenses_c: Optional[str] = Field(None, description="Row 25 Column C")
-    total_functional_expenses_d: Optional[str] = Field(None, description="Row 25 Column D")
-    joint_costs: Optional[str] = Field(None, description="Row 26 Column A")
+    model_config = ConfigDict(extra='ignore', validate_assignment=True)
+
+    @field_validator('*', mode='before')
+    @classmethod
+    def _coerce_monetary(cls, value):
+        return _parse_monetary(value)
+
+    grants_domestic_organizations: Optional[Decimal] = Field(None, description="Row 1 Column A")
+    professional_fundraising_services: Optional[Decimal] = Field(None, description="Row 11e Column A")
+    affiliate_payments: Optional[Decimal] = Field(None, description="Row 21 Column A")
+    total_functional_expenses_a: Optional[Decimal] = Field(None, description="Row 25 Column A")
+    total_functional_expenses_b: Optional[Decimal] = Field(None, description="Row 25 Column B")
+    total_functional_expenses_c: Optional[Decimal] = Field(None, description="Row 25 Column C")
+    total_functional_expenses_d: Optional[Decimal] = Field(None, description="Row 25 Column D")
+    joint_costs: Optional[Decimal] = Field(None, description="Row 26 Column A")
 
 
 class ExtractionResult(BaseModel):
     """Complete extraction result from a Form 990 PDF"""
+    model_config = ConfigDict(extra='ignore', validate_assignment=False)
+
     filename: str
-    extraction_date: datetime = Field(default_factory=datetime.now)
-    page1: Page1Fields = Field(default_factory=Page1Fields)
-    part_viii: PartVIIIFields = Field(default_factory=PartVIIIFields)
-    part_ix: PartIXFields = Field(default_factory=PartIXFields)
+    extraction_date: datetime = Field(default_factory=datetime.utcnow)
+    # The extractor always supplies these; no default instances are built
+    page1: Optional[Page1Fields] = None
+    part_viii: Optional[PartVIIIFields] = None
+    part_ix: Optional[PartIXFields] = None
     raw_text: Optional[str] = None
     extraction_method: str = "pdfplumber"
     confidence_score: Optional[float] = None
@@ -90,6 +140,8 @@ class ExtractionResult(BaseModel):
 
 class ExtractionResponse(BaseModel):
     """API response for extraction endpoint"""
+    model_config = ConfigDict(extra='ignore', validate_assignment=False)
+
     success: bool
     message: str
     data: Optional[ExtractionResult] = None
@@ -97,117 +149,179 @@ class ExtractionResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """API health check response"""
+    model_config = ConfigDict(extra='ignore', validate_assignment=False)
+
     status: str
     version: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 # V2 Models with Confidence Scoring
 
 class FieldWithConfidence(BaseModel):
     """Field value with confidence score and metadata"""
+    # Frozen: instances (including the shared empty sentinel) are immutable
+    # data carriers; extractors build replacements rather than mutating.
+    # defer_build skips core-schema construction at import; the app rebuilds
+    # the V2 response chain once at startup.
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     value: Optional[str]
     confidence: float = Field(description="Confidence score 0.0-1.0")
     warnings: List[str] = Field(default_factory=list)
     source: str = Field(default="unknown", description="Extraction source: table, text_pattern, ocr")
 
 
-class Page1FieldsV2(BaseModel):
+# Shared empty-field sentinel built once with model_construct, so the ~60
+# default_factory calls per V2 result stop re-validating identical objects.
+# Extractors replace whole field objects instead of mutating them in place.
+_EMPTY_FIELD = FieldWithConfidence.model_construct(
+    value=None, confidence=0.0, warnings=[], source="none"
+)
+
+
+class FieldsWithConfidenceBase(BaseModel):
+    """Base for V2 field containers, adding array-style bulk accessors.
+
+    The per-field FieldWithConfidence layout is part of the API schema, so
+    these helpers expose the struct-of-arrays view (parallel name/value/
+    confidence sequences) without changing storage.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def field_names(cls) -> List[str]:
+        """Field names in declaration order"""
+        return list(cls.model_fields)
+
+    def value_list(self) -> List[Optional[str]]:
+        """Field values in declaration order"""
+        return [getattr(self, name).value for name in self.__class__.model_fields]
+
+    def confidence_vector(self, quantize: bool = False) -> "np.ndarray":
+        """Confidences in declaration order as a numpy array.
+
+        Enables vectorized thresholding, e.g.
+        (fields.confidence_vector() >= threshold).all().
+
+        Args:
+            quantize: If True, return uint8 values (round(confidence * 255))
+                instead of float32 - an 8x smaller array for storage, with
+                thresholds compared as round(threshold * 255)
+        """
+        import numpy as np  # deferred: only bulk-scoring callers need numpy
+        fields = self.__class__.model_fields
+        if quantize:
+            return np.fromiter(
+                (round(getattr(self, name).confidence * 255) for name in fields),
+                dtype=np.uint8,
+                count=len(fields)
+            )
+        return np.fromiter(
+            (getattr(self, name).confidence for name in fields),
+            dtype=np.float32,
+            count=len(fields)
+        )
+
+
+class Page1FieldsV2(FieldsWithConfidenceBase):
     """Page 1 fields with confidence scores"""
-    employer_identification_number: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    gross_receipts: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_contributions: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_revenue: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    grants_and_similar_amounts_paid: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    salaries_compensation_benefits: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    professional_fundraising_fees: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_fundraising_expenses: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_assets: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_liabilities: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    net_assets_or_fund_balances: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-
-
-class PartVIIIFieldsV2(BaseModel):
+    employer_identification_number: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    gross_receipts: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_contributions: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_revenue: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    grants_and_similar_amounts_paid: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    salaries_compensation_benefits: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    professional_fundraising_fees: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_fundraising_expenses: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_assets: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_liabilities: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    net_assets_or_fund_balances: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+
+
+class PartVIIIFieldsV2(FieldsWithConfidenceBase):
     """Part VIII fields with confidence scores"""
     # Row 1: Contributions
-    federated_campaigns: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    membership_dues: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    fundraising_events: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    related_organizations: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    government_grants: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    all_other_contributions: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    noncash_contributions: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    contributions_total: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    federated_campaigns: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    membership_dues: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    fundraising_events: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    related_organizations: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    government_grants: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    all_other_contributions: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    noncash_contributions: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    contributions_total: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 2: Program Service Revenue
-    program_service_revenue_total: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    program_service_revenue_total: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 3: Investment Income
-    investment_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    investment_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 4: Tax-exempt bond income
-    tax_exempt_bond_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    tax_exempt_bond_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 5: Royalties
-    royalties: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    royalties: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 6: Rental Income
-    gross_rents_real: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    gross_rents_personal: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    rental_expenses_real: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    rental_expenses_personal: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    rental_income_real: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    rental_income_personal: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    net_rental_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    gross_rents_real: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    gross_rents_personal: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    rental_expenses_real: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    rental_expenses_personal: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    rental_income_real: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    rental_income_personal: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    net_rental_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 7: Capital Gains/Losses
-    gross_sales_securities: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    gross_sales_other: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    cost_basis_securities: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    cost_basis_other: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    gain_loss_securities: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    gain_loss_other: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    net_gain_loss: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    gross_sales_securities: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    gross_sales_other: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    cost_basis_securities: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    cost_basis_other: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    gain_loss_securities: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    gain_loss_other: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    net_gain_loss: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 8: Fundraising Events
-    fundraising_gross_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    fundraising_8a_other: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    fundraising_direct_expenses: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    fundraising_net_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    fundraising_gross_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    fundraising_8a_other: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    fundraising_direct_expenses: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    fundraising_net_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 9: Gaming
-    gaming_gross_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    gaming_direct_expenses: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    gaming_net_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    gaming_gross_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    gaming_direct_expenses: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    gaming_net_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 10: Inventory Sales
-    inventory_gross_sales: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    inventory_cost_of_goods: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    inventory_net_income: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    inventory_gross_sales: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    inventory_cost_of_goods: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    inventory_net_income: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 11: Other Revenue
-    other_revenue_total: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    other_revenue_total: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
     # Row 12: Total Revenue
-    total_revenue: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    total_revenue: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
 
-class PartIXFieldsV2(BaseModel):
+class PartIXFieldsV2(FieldsWithConfidenceBase):
     """Part IX fields with confidence scores"""
-    grants_domestic_organizations: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    professional_fundraising_services: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    affiliate_payments: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_functional_expenses_a: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_functional_expenses_b: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_functional_expenses_c: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    total_functional_expenses_d: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
-    joint_costs: FieldWithConfidence = Field(default_factory=lambda: FieldWithConfidence(value=None, confidence=0.0, source="none"))
+    grants_domestic_organizations: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    professional_fundraising_services: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    affiliate_payments: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_functional_expenses_a: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_functional_expenses_b: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_functional_expenses_c: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    total_functional_expenses_d: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
+    joint_costs: FieldWithConfidence = Field(default_factory=lambda: _EMPTY_FIELD)
 
 
 class ExtractionResultV2(BaseModel):
     """Enhanced extraction result with confidence scoring"""
+    model_config = ConfigDict(defer_build=True)
+
     filename: str
-    extraction_date: datetime = Field(default_factory=datetime.now)
+    extraction_date: datetime = Field(default_factory=datetime.utcnow)
     page1: Page1FieldsV2 = Field(default_factory=Page1FieldsV2)
     part_viii: PartVIIIFieldsV2 = Field(default_factory=PartVIIIFieldsV2)
     part_ix: PartIXFieldsV2 = Field(default_factory=PartIXFieldsV2)
@@ -227,6 +341,8 @@ class ExtractionResultV2(BaseModel):
 
 class ExtractionResponseV2(BaseModel):
     """API response for v2 extraction endpoint"""
+    model_config = ConfigDict(defer_build=True)
+
     success: bool
     message: str
     data: Optional[ExtractionResultV2] = None
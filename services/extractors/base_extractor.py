@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Word:
     """Represents a word in a PDF with its bounding box"""
     text: str
@@ -31,7 +31,7 @@ class Word:
         return self.y1 - self.y0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TableCell:
     """Represents a cell in an extracted table"""
     text: str
@@ -47,30 +47,103 @@ class TableCell:
         return (self.x0, self.y0, self.x1, self.y1)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Table:
     """Represents an extracted table with cells"""
-    cells: List[List[Optional[str]]]  # 2D array of cell values
+    cells: "np.ndarray"  # (num_rows, num_cols) object array of cell values
     page_number: int
     x0: float = 0.0
     y0: float = 0.0
     x1: float = 0.0
     y1: float = 0.0
 
+    @classmethod
+    def from_nested(cls, rows: List[List[Optional[str]]], page_number: int,
+                    x0: float = 0.0, y0: float = 0.0,
+                    x1: float = 0.0, y1: float = 0.0) -> "Table":
+        """Build a Table from nested row lists, padding ragged rows with None.
+
+        The flat object array keeps cells contiguous (no per-row list
+        objects) and makes the row/column counts shape lookups.
+        """
+        import numpy as np
+        num_cols = max((len(row) for row in rows), default=0)
+        arr = np.empty((len(rows), num_cols), dtype=object)
+        for i, row in enumerate(rows):
+            arr[i, :len(row)] = row
+        return cls(cells=arr, page_number=page_number, x0=x0, y0=y0, x1=x1, y1=y1)
+
     @property
     def bbox(self) -> Tuple[float, float, float, float]:
         return (self.x0, self.y0, self.x1, self.y1)
 
     @property
     def num_rows(self) -> int:
-        return len(self.cells)
+        return self.cells.shape[0]
 
     @property
     def num_cols(self) -> int:
-        return max(len(row) for row in self.cells) if self.cells else 0
+        return self.cells.shape[1]
+
 
+class WordArray:
+    """Struct-of-arrays view over extracted words.
 
-@dataclass
+    Instead of one Word object per text line, columns are stored as
+    parallel sequences: texts as a Python list, coordinates and page
+    numbers as numpy arrays. This keeps thousands of words in a handful
+    of allocations and lets callers filter bounding boxes vectorized,
+    e.g. np.where((wa.x0 >= xmin) & (wa.y0 >= ymin)). Iteration yields
+    Word objects for code still expecting the dataclass.
+    """
+    __slots__ = ('texts', 'x0', 'y0', 'x1', 'y1', 'page_numbers')
+
+    def __init__(self, texts, x0, y0, x1, y1, page_numbers):
+        self.texts = texts
+        self.x0 = x0
+        self.y0 = y0
+        self.x1 = x1
+        self.y1 = y1
+        self.page_numbers = page_numbers
+
+    @classmethod
+    def from_words(cls, words: List[Word]) -> "WordArray":
+        """Pack a list of Word objects into parallel columns.
+
+        Coordinates are stored as float32 and page numbers as int32: PDF
+        layout coordinates are points in the 0-1000 range, where float32's
+        ~7 significant digits are already sub-pixel, and the narrower types
+        halve the memory bandwidth of bbox filters. Callers comparing
+        against these columns should keep operands in float32 to avoid
+        implicit upcasts.
+        """
+        import numpy as np
+        n = len(words)
+        return cls(
+            texts=[w.text for w in words],
+            x0=np.fromiter((w.x0 for w in words), dtype=np.float32, count=n),
+            y0=np.fromiter((w.y0 for w in words), dtype=np.float32, count=n),
+            x1=np.fromiter((w.x1 for w in words), dtype=np.float32, count=n),
+            y1=np.fromiter((w.y1 for w in words), dtype=np.float32, count=n),
+            page_numbers=np.fromiter((w.page_number for w in words), dtype=np.int32, count=n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self):
+        for i in range(len(self.texts)):
+            yield Word(
+                text=self.texts[i],
+                x0=float(self.x0[i]),
+                y0=float(self.y0[i]),
+                x1=float(self.x1[i]),
+                y1=float(self.y1[i]),
+                page_number=int(self.page_numbers[i]),
+            )
+
+
+@dataclass(slots=True)
 class ExtractionResult:
     """
     Result from PDF extraction containing text, tables, and metadata
@@ -81,6 +154,9 @@ class ExtractionResult:
     words: List[Word] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     extractor_name: str = "unknown"
+    # Filled lazily by the combiner so the multi-MB artifact scan over text
+    # runs at most once per result
+    ocr_quality_score: Optional[float] = None
 
     @property
     def num_pages(self) -> int:
@@ -104,12 +180,17 @@ class BasePDFExtractor(ABC):
         pass
 
     @abstractmethod
-    def extract(self, filepath: str) -> ExtractionResult:
+    def extract(self, filepath: str, *, include_tables: bool = True,
+                include_words: bool = True) -> ExtractionResult:
         """
         Extract all data from a PDF file
 
         Args:
             filepath: Path to the PDF file
+            include_tables: Run table detection (often the most expensive
+                per-page step); when False, the result's tables are empty
+            include_words: Materialize Word objects; when False, the
+                result's words are empty
 
         Returns:
             ExtractionResult containing text, tables, words, and metadata
@@ -168,6 +249,21 @@ class BasePDFExtractor(ABC):
         """
         pass
 
+    def extract_text_only(self, filepath: str) -> str:
+        """
+        Extract just the document text, skipping tables and word boxes
+
+        Extractors with a cheaper text-only path should override this;
+        the default falls back to a full extract().
+
+        Args:
+            filepath: Path to the PDF file
+
+        Returns:
+            Extracted text as string
+        """
+        return self.extract(filepath, include_tables=False, include_words=False).text
+
     def validate_file(self, filepath: str) -> bool:
         """
         Validate that the file exists and can be processed
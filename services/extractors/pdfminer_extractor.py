@@ -7,11 +7,30 @@ from pdfminer.layout import LAParams, LTTextBox, LTTextLine, LTChar, LTFigure, L
 from typing import List, Tuple, Dict, Any
 import logging
 
+import numpy as np
+
 from .base_extractor import BasePDFExtractor, ExtractionResult, Word, Table
 
 logger = logging.getLogger(__name__)
 
 
+def _iter_layout_leaves(root, leaf_types):
+    """Walk a pdfminer layout tree iteratively, yielding matching leaves.
+
+    Elements of leaf_types are yielded without descending into them; any
+    other iterable container (LTFigure, LTPage, ...) is expanded onto an
+    explicit stack, so deeply nested layouts cost no recursive call frames.
+    Children are pushed reversed to preserve the tree's document order.
+    """
+    stack = [root]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, leaf_types):
+            yield element
+        elif hasattr(element, '__iter__'):
+            stack.extend(reversed(list(element)))
+
+
 class PDFMinerExtractor(BasePDFExtractor):
     """
     PDF extractor using pdfminer.six library
@@ -39,11 +58,12 @@ class PDFMinerExtractor(BasePDFExtractor):
     def name(self) -> str:
         return "pdfminer"
 
-    def extract(self, filepath: str) -> ExtractionResult:
+    def extract(self, filepath: str, *, include_tables: bool = True,
+                include_words: bool = True) -> ExtractionResult:
         """Extract all data from PDF using pdfminer.six"""
         self.validate_file(filepath)
 
-        full_text = ""
+        text_parts = []
         pages_data = []
         all_words = []
         all_tables = []
@@ -57,11 +77,11 @@ class PDFMinerExtractor(BasePDFExtractor):
                 page_text = self.extract_text(page_layout)
 
                 # Extract words with coordinates
-                page_words = self.extract_words(page_layout)
-                all_words.extend(page_words)
+                if include_words:
+                    all_words.extend(self.extract_words(page_layout))
 
                 # Extract tables (basic implementation)
-                page_tables = self.extract_tables(page_layout)
+                page_tables = self.extract_tables(page_layout) if include_tables else []
                 all_tables.extend(page_tables)
 
                 # Get dimensions
@@ -76,7 +96,11 @@ class PDFMinerExtractor(BasePDFExtractor):
                     "height": height,
                 }
                 pages_data.append(page_data)
-                full_text += f"\n--- Page {page_num} ---\n{page_text}\n"
+                text_parts.append(f"\n--- Page {page_num} ---\n{page_text}\n")
+
+            # Join once at the end: += in the loop recopies the accumulated
+            # text every page, going quadratic on long documents
+            full_text = "".join(text_parts)
 
             logger.info(f"PDFMiner extracted {len(pages_data)} pages, "
                        f"{len(all_tables)} tables, {len(all_words)} words")
@@ -102,32 +126,21 @@ class PDFMinerExtractor(BasePDFExtractor):
 
     def extract_text(self, page_layout: LTPage) -> str:
         """Extract text from page layout preserving structure"""
-        text_elements = []
-
-        def extract_text_from_element(element):
-            """Recursively extract text from layout elements"""
-            if isinstance(element, (LTTextBox, LTTextLine)):
-                text_elements.append({
-                    'text': element.get_text(),
-                    'y0': element.y0,
-                    'x0': element.x0
-                })
-            elif isinstance(element, LTFigure):
-                # Recursively process figures
-                for child in element:
-                    extract_text_from_element(child)
-            elif hasattr(element, '__iter__'):
-                for child in element:
-                    extract_text_from_element(child)
-
-        extract_text_from_element(page_layout)
-
-        # Sort by y-coordinate (top to bottom), then x-coordinate (left to right)
-        # Note: PDF coordinates have origin at bottom-left
-        text_elements.sort(key=lambda e: (-e['y0'], e['x0']))
+        elements = list(_iter_layout_leaves(page_layout, (LTTextBox, LTTextLine)))
+        if not elements:
+            return ''
+
+        # Sort by y-coordinate (top to bottom), then x-coordinate (left to
+        # right); PDF coordinates have origin at bottom-left. lexsort builds
+        # the permutation in C, replacing a timsort of Python tuples that
+        # shows up on text-dense pages.
+        n = len(elements)
+        y0 = np.fromiter((e.y0 for e in elements), dtype=np.float32, count=n)
+        x0 = np.fromiter((e.x0 for e in elements), dtype=np.float32, count=n)
+        order = np.lexsort((x0, -y0))
 
         # Combine text
-        return ''.join(e['text'] for e in text_elements)
+        return ''.join(elements[i].get_text() for i in order)
 
     def extract_tables(self, page_layout: LTPage) -> List[Table]:
         """
@@ -145,33 +158,31 @@ class PDFMinerExtractor(BasePDFExtractor):
         words = []
         page_num = page_layout.pageid if hasattr(page_layout, 'pageid') else 1
 
-        def extract_words_from_element(element, current_page):
-            """Recursively extract words from layout elements"""
-            if isinstance(element, LTTextLine):
-                # Get text and bbox from text line
-                text = element.get_text().strip()
-                if text:
-                    word = Word(
-                        text=text,
-                        x0=element.x0,
-                        y0=element.y0,
-                        x1=element.x1,
-                        y1=element.y1,
-                        page_number=current_page
-                    )
-                    words.append(word)
-
-            elif isinstance(element, LTFigure):
-                for child in element:
-                    extract_words_from_element(child, current_page)
-
-            elif hasattr(element, '__iter__'):
-                for child in element:
-                    extract_words_from_element(child, current_page)
-
-        extract_words_from_element(page_layout, page_num)
+        for element in _iter_layout_leaves(page_layout, LTTextLine):
+            # Get text and bbox from text line
+            text = element.get_text().strip()
+            if text:
+                words.append(Word(
+                    text=text,
+                    x0=element.x0,
+                    y0=element.y0,
+                    x1=element.x1,
+                    y1=element.y1,
+                    page_number=page_num
+                ))
+
         return words
 
     def get_page_dimensions(self, page_layout: LTPage) -> Tuple[float, float]:
         """Get page dimensions"""
         return (page_layout.width, page_layout.height)
+
+    def extract_text_only(self, filepath: str) -> str:
+        """Extract text without building the full layout tree.
+
+        pdfminer's high-level extract_text skips the per-element layout
+        objects that extract() walks, which is much cheaper when callers
+        only need text (no words, tables or coordinates).
+        """
+        self.validate_file(filepath)
+        return extract_text(filepath, laparams=self.laparams)
@@ -3,183 +3,277 @@ Enhanced Part VIII Extraction Methods
 Fixes for Row 7a and other missing fields
 """
 import re
-from typing import List, Optional
+from bisect import bisect_left
+from typing import List, Optional, Tuple
 
+# RE2 runs every pattern in guaranteed linear time, which bounds the
+# worst case on adversarial OCR output: the digit-run patterns here
+# (e.g. the pre-value row forms) can backtrack badly under CPython's re
+# when a section contains long runs of digits without the terminator.
+# The module mirrors the re API, so matches are drop-in; re remains the
+# fallback when google-re2 isn't installed.
+try:
+    import re2 as _engine
+except ImportError:
+    _engine = re
 
-def extract_row_7a_enhanced(section: str, field_extractor) -> tuple:
-    """
-    Enhanced extraction for Row 7a (Gross sales - Securities vs Other)
-    Handles multiple text variations and formats
+# All patterns are compiled once at import; the extraction functions run
+# per document (and some per section), so re.search(str, ...) was paying
+# the pattern-cache lookup on every probe
 
-    Returns: (gross_sales_securities, gross_sales_other)
+# One translate() drops both separators in a single C-level pass, where
+# the old .replace(',','').replace('.','') chain scanned and reallocated
+# the string twice per candidate amount
+_STRIP_SEPARATORS = str.maketrans('', '', ',.')
+
+
+def _is_year(amount: str) -> bool:
+    """True when the amount is a bare 4-digit year (19xx/20xx)."""
+    digits = amount.translate(_STRIP_SEPARATORS)
+    return len(digits) == 4 and digits[:2] in ('19', '20')
+
+
+def _first_two(seq) -> Tuple[Optional[str], Optional[str]]:
+    """First two items of a sequence, padded with None."""
+    it = iter(seq)
+    return next(it, None), next(it, None)
+
+
+def _amounts_between(hits: List[Tuple[int, str]], offsets: List[int],
+                     start: int, end: int) -> List[str]:
+    """Amounts from a precomputed offset scan that start in [start, end).
+
+    hits is the output of _find_amounts_with_offsets over the whole
+    section and offsets its first column; a bisect replaces the old
+    slice-and-rescan per row window.
     """
-    # Pattern variations for different PDFs
-    patterns = [
-        r'\b7a\b[^\n]*Gross amount from sales of assets other than inventory',
-        r'\b7a\b[^\n]*Gross amount from sale',
-        r'\b7a\b[^\n]*sales of assets other than inventory',
-        r'Gross amount from sales? of assets other than inventory[^\n]*7a',
-        r'\b7a\b[^\n]*assets other than inventory',
-    ]
-
-    for pattern in patterns:
-        # Try to find the row
-        match = re.search(pattern, section, re.IGNORECASE)
-        if match:
-            # Get the matched line and next few lines (for multi-line values)
-            start = match.start()
-            end = match.end()
-            extended_text = section[start:end+300]  # Get next 300 chars
-
-            # Extract all monetary amounts
-            amounts = field_extractor._find_amounts_in_text(extended_text)
+    return [a for _, a in hits[bisect_left(offsets, start):bisect_left(offsets, end)]]
 
-            if amounts:
-                # Return first two values (Securities, Other)
-                securities = amounts[0] if len(amounts) >= 1 else None
-                other = amounts[1] if len(amounts) >= 2 else None
 
-                # Validate that these look like valid amounts (not row numbers)
-                if securities and len(securities.replace(',', '').replace('.', '')) >= 4:
-                    return (securities, other)
+def _union(patterns: List[str]) -> "re.Pattern":
+    """Join alternative patterns into one alternation.
+
+    Each field's candidate patterns used to be tried in separate
+    re.search passes over the same section; the union finds every
+    candidate hit in a single left-to-right scan.
+    """
+    return _engine.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+# Patterns below are written in lowercase and compiled without
+# re.IGNORECASE: the extraction functions lowercase their input once
+# per call, which is cheaper than per-character case folding across the
+# ~10 scans the same section goes through. Every value extracted here
+# is a digit amount, so matching and slicing against the lowered copy
+# is safe.
+
+# Pattern variations for different PDFs
+_ROW7A_UNION = _union([
+    r'\b7a\b[^\n]*gross amount from sales of assets other than inventory',
+    r'\b7a\b[^\n]*gross amount from sale',
+    r'\b7a\b[^\n]*sales of assets other than inventory',
+    r'gross amount from sales? of assets other than inventory[^\n]*7a',
+    r'\b7a\b[^\n]*assets other than inventory',
+])
+_ROW7A_CODE_RE = re.compile(r'\b7a\b')
+_SECURITIES_COL_RE = re.compile(r'\(i\)\s*securities[^\n]*')
+
+# Row 12 patterns that avoid year confusion
+_TOTAL_REVENUE_UNION = _union([
+    # Pattern 1: Row 12 followed by "Total revenue"
+    r'\b12\b[^\d]*total revenue[^\n]*',
+    # Pattern 2: "Total revenue" with explicit row marker
+    r'total revenue[^\n]*\b12\b',
+    # Pattern 3: "Total revenue" near "See instructions" or "line 12"
+    r'total revenue[^\n]*(?:see instructions|line 12)',
+    # Pattern 4: Just "12" and "Total revenue" with some context
+    r'(?:row|line)?\s*12[^\d]*total revenue',
+])
+
+_SUMMARY_TABLE_RE = re.compile(
+    r'prior year\s+current year(.*?)(?:grants and similar|benefits paid)',
+    re.DOTALL
+)
+_PART1_SECTION_RE = re.compile(
+    r'part\s+i\s+summary(.*?)(?:part\s+ii|statement of program service)',
+    re.DOTALL
+)
+_PART1_ALT_RE = re.compile(
+    r'(?:contributions and grants|row 8)(.*?)(?:part\s+ii|part\s+iii)',
+    re.DOTALL
+)
+
+_ROW8_UNION = _union([
+    r'(?:8|row 8|line 8)[^\n]*(?:contributions and grants|total contributions)[^\n]*',
+    r'contributions and grants[^\n]*(?:\bline 1h\b|\b8\b)',
+])
+_ROW20_UNION = _union([
+    r'(?:20|row 20|line 20)[^\n]*total assets[^\n]*',
+    r'total assets[^\n]*(?:\bline 16\b|\b20\b)',
+])
+_ROW21_UNION = _union([
+    r'(?:21|row 21|line 21)[^\n]*total liabilities[^\n]*',
+    r'total liabilities[^\n]*(?:\b21\b|\bline 21\b)',
+])
+# The three 2022-style "values before label" forms (rows 20/21/22) used
+# to each scan the full document text; one alternation finds all of them
+# in a single finditer pass, dispatched by which top-level named group
+# matched
+_PAGE1_PRE_VALUE_MULTI = _engine.compile(
+    r'(?P<assets>(?:\d{1,3}(?:,\d{3})+)\s*[\n\r]+\s*(?P<assets_eoy>\d{1,3}(?:,\d{3})+)\s*[\n\r]+\s*total assets)'
+    r'|(?P<liab>(?P<liab_vals>(?:\d{1,3}(?:,\d{3})+\s*){1,2})total liabilities)'
+    r'|(?P<net>(?:\d{1,3}(?:,\d{3})+)\s*[\n\r]+\s*(?P<net_eoy>\d{1,3}(?:,\d{3})+)[\s\S]{0,200}?net assets or fund balances)'
+)
+_ROW22_UNION = _union([
+    r'(?:22|row 22|line 22)[^\n]*net assets[^\n]*',
+    r'net assets.*fund balances[^\n]*(?:\b22\b|\bline 22\b)',
+])
+
+# Row 1h is often formatted as "Total. Add lines 1a-1f"
+_ROW1H_UNION = _union([
+    r'\b1h\b[^\n]*total[^\n]*(?:add lines 1a|lines 1a-1f)',
+    r'total[^\n]*add lines 1a[^\n]*\b1h\b',
+    r'\bh\b[^\n]*total[^\n]*add lines 1a',
+])
+_ROW2G_UNION = _union([
+    r'\b2g\b[^\n]*total[^\n]*(?:add lines 2a|program service revenue)',
+    r'total[^\n]*(?:add lines 2a|program service revenue)[^\n]*\b2g\b',
+    r'\bg\b[^\n]*total[^\n]*add lines 2a',
+])
+
+
+def _row_7a_impl(section: str, hits: List[Tuple[int, str]],
+                 offsets: List[int], field_extractor) -> tuple:
+    """Row 7a extraction against a pre-lowered section and amount scan."""
+    # Every pattern variant requires the row code, so a C-level substring
+    # probe skips the regex machinery entirely on the common miss path
+    if '7a' not in section:
+        return (None, None)
+
+    # One scan of the alternation covers every pattern variant; keep
+    # iterating candidate hits so a failed validation falls through to
+    # the next occurrence like the old per-pattern loop did
+    for match in _ROW7A_UNION.finditer(section):
+        # Amounts on the matched line and the next few lines
+        # (multi-line values land within 300 chars of the row label)
+        amounts = _amounts_between(hits, offsets, match.start(), match.end() + 300)
+
+        if amounts:
+            # Return first two values (Securities, Other)
+            securities, other = _first_two(amounts)
+
+            # Validate that these look like valid amounts (not row numbers)
+            if securities and len(securities.translate(_STRIP_SEPARATORS)) >= 4:
+                return (securities, other)
 
     # Last resort: Look for row 7a with column headers
     # (i) Securities and (ii) Other
-    match_7a = re.search(r'\b7a\b', section, re.IGNORECASE)
+    match_7a = _ROW7A_CODE_RE.search(section)
     if match_7a:
-        # Look within next 500 characters for values
-        window = section[match_7a.start():match_7a.start()+500]
-
-        # Try to find (i) Securities and (ii) Other columns
-        securities_match = re.search(r'\(i\)\s*Securities[^\n]*', window, re.IGNORECASE)
+        # Try to find (i) Securities and (ii) Other columns within the
+        # next 500 characters
+        w_start = match_7a.start()
+        securities_match = _SECURITIES_COL_RE.search(section, w_start, w_start + 500)
         if securities_match:
-            securities_line = securities_match.group(0)
-            # Get amounts from next few lines
-            remaining = window[securities_match.end():]
-            amounts = field_extractor._find_amounts_in_text(remaining[:200])
+            # Get amounts from the next few lines
+            amounts = _amounts_between(hits, offsets, securities_match.end(),
+                                       securities_match.end() + 200)
             if amounts:
-                return (amounts[0] if len(amounts) >= 1 else None,
-                        amounts[1] if len(amounts) >= 2 else None)
+                return _first_two(amounts)
 
     return (None, None)
 
 
-def extract_total_revenue_enhanced(section: str, field_extractor) -> Optional[str]:
-    """
-    Enhanced extraction for Row 12 Total Revenue
-    Avoids matching years like "2024"
-    """
-    # Try specific patterns that avoid year confusion
-    patterns = [
-        # Pattern 1: Row 12 followed by "Total revenue"
-        r'\b12\b[^\d]*Total revenue[^\n]*',
-        # Pattern 2: "Total revenue" with explicit row marker
-        r'Total revenue[^\n]*\b12\b',
-        # Pattern 3: "Total revenue" near "See instructions" or "line 12"
-        r'Total revenue[^\n]*(?:See instructions|line 12)',
-        # Pattern 4: Just "12" and "Total revenue" with some context
-        r'(?:Row|Line)?\s*12[^\d]*Total revenue',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, section, re.IGNORECASE)
-        if match:
-            # Get the line and next few lines
-            matched_text = match.group(0)
-            start = match.start()
-            end = match.end()
-            extended = section[start:end+200]
-
-            # Find amounts
-            amounts = field_extractor._find_amounts_in_text(extended)
-
-            for amount in amounts:
-                # Skip if it looks like a year (exactly 4 digits, starts with 19 or 20)
-                clean = amount.replace(',', '').replace('.', '')
-                if len(clean) == 4 and (clean.startswith('19') or clean.startswith('20')):
-                    continue
-
-                # Valid amount should be longer or have commas
-                if len(clean) >= 5 or ',' in amount:
-                    return amount
+def _total_revenue_impl(section: str, hits: List[Tuple[int, str]],
+                        offsets: List[int], field_extractor) -> Optional[str]:
+    """Row 12 extraction against a pre-lowered section and amount scan."""
+    # Every pattern variant contains the literal label
+    if 'total revenue' not in section:
+        return None
+
+    for match in _TOTAL_REVENUE_UNION.finditer(section):
+        # Amounts on the matched line and the next few lines
+        amounts = _amounts_between(hits, offsets, match.start(), match.end() + 200)
+
+        for amount in amounts:
+            # Skip if it looks like a year (exactly 4 digits, starts with 19 or 20)
+            clean = amount.translate(_STRIP_SEPARATORS)
+            if len(clean) == 4 and clean[:2] in ('19', '20'):
+                continue
+
+            # Valid amount should be longer or have commas
+            if len(clean) >= 5 or ',' in amount:
+                return amount
 
     return None
 
 
-def extract_page1_enhanced(text: str, field_extractor) -> dict:
-    """
-    Enhanced extraction for Page 1 fields
-    Handles fragmented text in 2022-style PDFs
-    """
+def _page1_impl(text: str, field_extractor) -> dict:
+    """Page 1 extraction against pre-lowered document text."""
     enhancements = {}
 
     # Special handling for 2022-style PDFs where values appear in a summary table
     # before the row labels
-    summary_table_match = re.search(
-        r'Prior Year\s+Current Year(.*?)(?:Grants and similar|Benefits paid)',
-        text, re.DOTALL | re.IGNORECASE
-    )
+    summary_table_match = _SUMMARY_TABLE_RE.search(text)
 
     if summary_table_match:
         # Extract from summary table format
         table_text = summary_table_match.group(1)
-        lines = table_text.split('\n')
 
-        # Parse the table - usually has paired values (Prior Year, Current Year)
-        amounts = []
-        for line in lines:
-            line_amounts = field_extractor._find_amounts_in_text(line)
-            if line_amounts:
-                amounts.extend(line_amounts)
+        # Parse the table - usually has paired values (Prior Year, Current
+        # Year). Amounts never span newlines, so one offset scan of the
+        # whole table gives the same sequence the old per-line
+        # _find_amounts_in_text loop accumulated, and also answers the
+        # row 12 window below without a second pass
+        table_hits = field_extractor._find_amounts_with_offsets(table_text)
+        amounts = [a for _, a in table_hits]
 
         # Map amounts to fields based on typical Form 990 order
         # Row 8: Contributions (usually 1st pair)
         if len(amounts) >= 2:
             enhancements['total_contributions'] = amounts[1]  # Current Year
 
-        # Row 12: Total revenue (usually 5th value for Current Year in sequence)
-        # Look for the largest value which is usually total revenue
-        current_year_amounts = [amounts[i] for i in range(1, len(amounts), 2) if i < len(amounts)]
-        if current_year_amounts:
-            # Find the line with "Total revenue"
-            for i, line in enumerate(lines):
-                if 'Total revenue' in line or 'Total revenue-add' in line:
-                    # Get amounts from nearby lines
-                    nearby_text = '\n'.join(lines[max(0,i-5):i+5])
-                    nearby_amounts = field_extractor._find_amounts_in_text(nearby_text)
-                    if nearby_amounts:
-                        # Current Year is usually the second value or last value
-                        enhancements['total_revenue'] = nearby_amounts[-1] if len(nearby_amounts) % 2 == 1 else nearby_amounts[-1]
-                        break
+            # Row 12: Total revenue - take the amounts around the
+            # "Total revenue" label (a character window replaces the old
+            # line-splitting and nearby-lines join)
+            label_idx = table_text.find('total revenue')
+            if label_idx != -1:
+                nearby_amounts = _amounts_between(
+                    table_hits, [o for o, _ in table_hits],
+                    max(0, label_idx - 500), label_idx + 500)
+                if nearby_amounts:
+                    # Current Year is usually the last value
+                    enhancements['total_revenue'] = nearby_amounts[-1]
 
     # Find Part I Summary section
-    part1_match = re.search(
-        r'Part\s+I\s+Summary(.*?)(?:Part\s+II|Statement of Program Service)',
-        text, re.DOTALL | re.IGNORECASE
-    )
+    part1_match = _PART1_SECTION_RE.search(text)
 
     if not part1_match:
         # Try alternative: Look for row 8-22 which are Page 1 rows
-        part1_match = re.search(
-            r'(?:Contributions and grants|Row 8)(.*?)(?:Part\s+II|Part\s+III)',
-            text, re.DOTALL | re.IGNORECASE
-        )
-
-    section = part1_match.group(1) if part1_match else text[:10000]  # Increased window
+        part1_match = _PART1_ALT_RE.search(text)
+
+    if part1_match:
+        section = part1_match.group(1)
+        # The pre-value row forms sit near, but not always inside, the
+        # lazy Part I capture; one window around the match covers them
+        # without rescanning the whole document
+        window = text[max(0, part1_match.start() - 2000):part1_match.end() + 5000]
+    else:
+        section = text[:10000]  # Increased window
+        window = text[:15000]
 
     # Enhanced patterns for commonly missed fields
 
-    # Row 8: Total contributions (with Prior Year / Current Year columns)
-    row8_patterns = [
-        r'(?:8|Row 8|Line 8)[^\n]*(?:Contributions and grants|Total contributions)[^\n]*',
-        r'Contributions and grants[^\n]*(?:\bline 1h\b|\b8\b)',
-    ]
+    # One amount scan of the section answers every row window below
+    hits = field_extractor._find_amounts_with_offsets(section)
+    offsets = [o for o, _ in hits]
 
-    for pattern in row8_patterns:
-        match = re.search(pattern, section, re.IGNORECASE)
-        if match:
-            extended = section[match.start():match.start()+500]
-            amounts = field_extractor._find_amounts_in_text(extended)
+    # Row 8: Total contributions (with Prior Year / Current Year columns);
+    # both pattern variants require a contributions label, so a substring
+    # probe gates the regex scan
+    if 'contributions' in section:
+        for match in _ROW8_UNION.finditer(section):
+            amounts = _amounts_between(hits, offsets, match.start(), match.start() + 500)
 
             # Often there are two columns: Prior Year and Current Year
             # We want Current Year (usually the last/rightmost value)
@@ -187,156 +281,208 @@ def extract_page1_enhanced(text: str, field_extractor) -> dict:
                 enhancements['total_contributions'] = amounts[-1]  # Last value = Current Year
                 break
 
-    # Row 12: Total revenue
-    enhancements['total_revenue'] = extract_total_revenue_enhanced(section, field_extractor)
-
-    # Row 20: Total assets
-    # In 2022-style PDFs, format is: value1\nvalue2\nTotal assets
-    # Where value1 = Beginning, value2 = End of Year (what we want)
-    assets_match = re.search(
-        r'(\d{1,3}(?:,\d{3})+)\s*[\n\r]+\s*(\d{1,3}(?:,\d{3})+)\s*[\n\r]+\s*Total assets',
-        text, re.IGNORECASE
-    )
-    if assets_match:
-        # Second value is End of Year
-        enhancements['total_assets'] = assets_match.group(2)
-
-    if not enhancements.get('total_assets'):
-        row20_patterns = [
-            r'(?:20|Row 20|Line 20)[^\n]*Total assets[^\n]*',
-            r'Total assets[^\n]*(?:\bline 16\b|\b20\b)',
-        ]
-
-        for pattern in row20_patterns:
-            match = re.search(pattern, section, re.IGNORECASE)
-            if match:
-                extended = section[match.start():match.start()+500]
-                amounts = field_extractor._find_amounts_in_text(extended)
-                if amounts:
-                    # Filter out years
-                    valid_amounts = [a for a in amounts
-                                    if not (len(a.replace(',','').replace('.','')) == 4
-                                           and a.replace(',','').replace('.','').startswith(('19','20')))]
-                    if valid_amounts:
-                        enhancements['total_assets'] = valid_amounts[-1]
-                        break
+    # Row 12: Total revenue (the section and its amount scan are reused)
+    enhancements['total_revenue'] = _total_revenue_impl(section, hits, offsets,
+                                                        field_extractor)
+
+    # Rows 20-22 in 2022-style PDFs put the values BEFORE the label
+    # (value1\nvalue2\nLabel, value1 = Beginning, value2 = End of Year).
+    # Find all three forms in one pass over the Part I window, keeping
+    # the first hit per row
+    pre_value_hits = {}
+    pos = 0
+    while len(pre_value_hits) < 3:
+        m = _PAGE1_PRE_VALUE_MULTI.search(window, pos)
+        if not m:
+            break
+        if m.group('assets') is not None:
+            pre_value_hits.setdefault('assets', m.group('assets_eoy'))
+        elif m.group('liab') is not None:
+            pre_value_hits.setdefault('liab', m.group('liab_vals'))
+        else:
+            pre_value_hits.setdefault('net', m.group('net_eoy'))
+        # Resume just past the match start, not its end: the net form
+        # tolerates 200 chars of junk and can span the assets/liab
+        # regions, which would otherwise be skipped
+        pos = m.start() + 1
+
+    # Row 20: Total assets (End of Year value)
+    if pre_value_hits.get('assets'):
+        enhancements['total_assets'] = pre_value_hits['assets']
+
+    if not enhancements.get('total_assets') and 'total assets' in section:
+        for match in _ROW20_UNION.finditer(section):
+            amounts = _amounts_between(hits, offsets, match.start(), match.start() + 500)
+            if amounts:
+                # Filter out years
+                valid_amounts = [a for a in amounts if not _is_year(a)]
+                if valid_amounts:
+                    enhancements['total_assets'] = valid_amounts[-1]
+                    break
 
     # Row 21: Total liabilities
-    # Values appear BEFORE the label in 2022-style PDFs
-    if not enhancements.get('total_liabilities'):
-        # Look for pattern: amounts -> "Total liabilities"
-        liab_match = re.search(
-            r'((?:\d{1,3}(?:,\d{3})+\s*){1,2})Total liabilities',
-            text, re.IGNORECASE
-        )
-        if liab_match:
-            liab_amounts = field_extractor._find_amounts_in_text(liab_match.group(1))
-            if liab_amounts:
-                # End of Year value is the second value or the only value
-                enhancements['total_liabilities'] = liab_amounts[1] if len(liab_amounts) >= 2 else liab_amounts[0]
-
-    if not enhancements.get('total_liabilities'):
-        row21_patterns = [
-            r'(?:21|Row 21|Line 21)[^\n]*Total liabilities[^\n]*',
-            r'Total liabilities[^\n]*(?:\b21\b|\bline 21\b)',
-        ]
-
-        for pattern in row21_patterns:
-            match = re.search(pattern, section, re.IGNORECASE)
-            if match:
-                extended = section[match.start():match.start()+500]
-                amounts = field_extractor._find_amounts_in_text(extended)
-                if amounts:
-                    valid_amounts = [a for a in amounts
-                                    if not (len(a.replace(',','').replace('.','')) == 4
-                                           and a.replace(',','').replace('.','').startswith(('19','20')))]
-                    if valid_amounts:
-                        enhancements['total_liabilities'] = valid_amounts[-1]
-                        break
-
-    # Row 22: Net assets
-    # In 2022-style PDFs, format is: value1\nvalue2\n[possible OCR junk]\nNet assets or fund balances
-    if not enhancements.get('net_assets_or_fund_balances'):
-        # Allow up to 200 characters of junk between values and label
-        net_match = re.search(
-            r'(\d{1,3}(?:,\d{3})+)\s*[\n\r]+\s*(\d{1,3}(?:,\d{3})+)[\s\S]{0,200}?Net assets or fund balances',
-            text, re.IGNORECASE
-        )
-        if net_match:
-            # Second value is End of Year
-            enhancements['net_assets_or_fund_balances'] = net_match.group(2)
-
-    if not enhancements.get('net_assets_or_fund_balances'):
-        row22_patterns = [
-            r'(?:22|Row 22|Line 22)[^\n]*Net assets[^\n]*',
-            r'Net assets.*fund balances[^\n]*(?:\b22\b|\bline 22\b)',
-        ]
-
-        for pattern in row22_patterns:
-            match = re.search(pattern, section, re.IGNORECASE)
-            if match:
-                extended = section[match.start():match.start()+500]
-                amounts = field_extractor._find_amounts_in_text(extended)
-                if amounts:
-                    valid_amounts = [a for a in amounts
-                                    if not (len(a.replace(',','').replace('.','')) == 4
-                                           and a.replace(',','').replace('.','').startswith(('19','20')))]
-                    if valid_amounts:
-                        enhancements['net_assets_or_fund_balances'] = valid_amounts[-1]
-                        break
+    if not enhancements.get('total_liabilities') and pre_value_hits.get('liab'):
+        liab_amounts = field_extractor._find_amounts_in_text(pre_value_hits['liab'])
+        if liab_amounts:
+            # End of Year value is the second value or the only value
+            enhancements['total_liabilities'] = liab_amounts[1] if len(liab_amounts) >= 2 else liab_amounts[0]
+
+    if not enhancements.get('total_liabilities') and 'total liabilities' in section:
+        for match in _ROW21_UNION.finditer(section):
+            amounts = _amounts_between(hits, offsets, match.start(), match.start() + 500)
+            if amounts:
+                valid_amounts = [a for a in amounts if not _is_year(a)]
+                if valid_amounts:
+                    enhancements['total_liabilities'] = valid_amounts[-1]
+                    break
+
+    # Row 22: Net assets (the pattern tolerates up to 200 chars of OCR
+    # junk between the values and the label)
+    if not enhancements.get('net_assets_or_fund_balances') and pre_value_hits.get('net'):
+        enhancements['net_assets_or_fund_balances'] = pre_value_hits['net']
+
+    if not enhancements.get('net_assets_or_fund_balances') and 'net assets' in section:
+        for match in _ROW22_UNION.finditer(section):
+            amounts = _amounts_between(hits, offsets, match.start(), match.start() + 500)
+            if amounts:
+                valid_amounts = [a for a in amounts if not _is_year(a)]
+                if valid_amounts:
+                    enhancements['net_assets_or_fund_balances'] = valid_amounts[-1]
+                    break
 
     return enhancements
 
 
-def extract_part8_enhanced(section: str, field_extractor) -> dict:
-    """
-    Enhanced extraction for Part VIII fields
-    Handles all commonly missed fields
-    """
+def _part8_impl(section: str, hits: List[Tuple[int, str]],
+                offsets: List[int], field_extractor) -> dict:
+    """Part VIII extraction against a pre-lowered section and amount scan."""
     enhancements = {}
 
     # Row 7a: Gross sales (Securities vs Other)
-    securities, other = extract_row_7a_enhanced(section, field_extractor)
+    securities, other = _row_7a_impl(section, hits, offsets, field_extractor)
     if securities:
         enhancements['gross_sales_securities'] = securities
     if other:
         enhancements['gross_sales_other'] = other
 
     # Row 12: Total revenue (avoid extracting year)
-    total_rev = extract_total_revenue_enhanced(section, field_extractor)
+    total_rev = _total_revenue_impl(section, hits, offsets, field_extractor)
     if total_rev:
         enhancements['total_revenue'] = total_rev
 
-    # Row 1h: Contributions total (often formatted as "Total. Add lines 1a-1f")
-    row1h_patterns = [
-        r'\b1h\b[^\n]*Total[^\n]*(?:Add lines 1a|lines 1a-1f)',
-        r'Total[^\n]*Add lines 1a[^\n]*\b1h\b',
-        r'\bh\b[^\n]*Total[^\n]*Add lines 1a',
-    ]
-
-    for pattern in row1h_patterns:
-        match = re.search(pattern, section, re.IGNORECASE)
-        if match:
-            extended = section[match.start():match.start()+300]
-            amounts = field_extractor._find_amounts_in_text(extended)
+    # Row 1h: Contributions total (often formatted as "Total. Add lines
+    # 1a-1f"); every pattern variant requires the "lines 1a" literal
+    if 'lines 1a' in section:
+        for match in _ROW1H_UNION.finditer(section):
+            amounts = _amounts_between(hits, offsets, match.start(), match.start() + 300)
             if amounts:
                 enhancements['contributions_total'] = amounts[0]
                 break
 
     # Row 2g: Program service revenue total
-    row2g_patterns = [
-        r'\b2g\b[^\n]*Total[^\n]*(?:Add lines 2a|program service revenue)',
-        r'Total[^\n]*(?:Add lines 2a|program service revenue)[^\n]*\b2g\b',
-        r'\bg\b[^\n]*Total[^\n]*Add lines 2a',
-    ]
-
-    for pattern in row2g_patterns:
-        match = re.search(pattern, section, re.IGNORECASE)
-        if match:
-            extended = section[match.start():match.start()+300]
-            amounts = field_extractor._find_amounts_in_text(extended)
+    if 'lines 2a' in section or 'program service revenue' in section:
+        for match in _ROW2G_UNION.finditer(section):
+            amounts = _amounts_between(hits, offsets, match.start(), match.start() + 300)
             if amounts:
                 enhancements['program_service_revenue_total'] = amounts[0]
                 break
 
     return enhancements
+
+
+class EnhancedExtractor:
+    """Stateful front end for the enhanced extraction routines.
+
+    Holds the field extractor plus per-document state - the lowered
+    text and the amount offset scan - so callers that run several
+    extractions against the same text (e.g. Part VIII row 7a, row 12
+    and the 1h/2g totals) fold case and scan for amounts once instead
+    of once per call. The compiled patterns stay module-level; they are
+    shared by every instance.
+    """
+
+    def __init__(self, field_extractor):
+        self.field_extractor = field_extractor
+        self._prepared_for: Optional[str] = None
+        self._lowered = ''
+        self._hits: Optional[List[Tuple[int, str]]] = None
+        self._offsets: List[int] = []
+
+    def prepare(self, text: str) -> None:
+        """Cache the lowered text for a document.
+
+        Keyed on string identity: repeated calls with the same text
+        object are no-ops, a new document replaces the cached state.
+        The amount scan is computed lazily by the extractions that
+        need it.
+        """
+        if text is self._prepared_for:
+            return
+        self._prepared_for = text
+        self._lowered = text.lower()
+        self._hits = None
+
+    def _amount_scan(self) -> Tuple[List[Tuple[int, str]], List[int]]:
+        if self._hits is None:
+            self._hits = self.field_extractor._find_amounts_with_offsets(self._lowered)
+            self._offsets = [o for o, _ in self._hits]
+        return self._hits, self._offsets
+
+    def extract_row_7a(self, section: str) -> tuple:
+        self.prepare(section)
+        hits, offsets = self._amount_scan()
+        return _row_7a_impl(self._lowered, hits, offsets, self.field_extractor)
+
+    def extract_total_revenue(self, section: str) -> Optional[str]:
+        self.prepare(section)
+        hits, offsets = self._amount_scan()
+        return _total_revenue_impl(self._lowered, hits, offsets, self.field_extractor)
+
+    def extract_page1(self, text: str) -> dict:
+        # Page 1 works on a Part I slice internally, so only the lowered
+        # text is shared here
+        self.prepare(text)
+        return _page1_impl(self._lowered, self.field_extractor)
+
+    def extract_part8(self, section: str) -> dict:
+        self.prepare(section)
+        hits, offsets = self._amount_scan()
+        return _part8_impl(self._lowered, hits, offsets, self.field_extractor)
+
+
+# Free-function API kept for existing callers; each call folds case and
+# scans for amounts itself, so EnhancedExtractor is preferable when
+# running several extractions against the same text
+
+def extract_row_7a_enhanced(section: str, field_extractor) -> tuple:
+    """
+    Enhanced extraction for Row 7a (Gross sales - Securities vs Other)
+    Handles multiple text variations and formats
+
+    Returns: (gross_sales_securities, gross_sales_other)
+    """
+    return EnhancedExtractor(field_extractor).extract_row_7a(section)
+
+
+def extract_total_revenue_enhanced(section: str, field_extractor) -> Optional[str]:
+    """
+    Enhanced extraction for Row 12 Total Revenue
+    Avoids matching years like "2024"
+    """
+    return EnhancedExtractor(field_extractor).extract_total_revenue(section)
+
+
+def extract_page1_enhanced(text: str, field_extractor) -> dict:
+    """
+    Enhanced extraction for Page 1 fields
+    Handles fragmented text in 2022-style PDFs
+    """
+    return EnhancedExtractor(field_extractor).extract_page1(text)
+
+
+def extract_part8_enhanced(section: str, field_extractor) -> dict:
+    """
+    Enhanced extraction for Part VIII fields
+    Handles all commonly missed fields
+    """
+    return EnhancedExtractor(field_extractor).extract_part8(section)
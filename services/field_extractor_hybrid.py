@@ -9,7 +9,7 @@ from services.extractors.pdfplumber_extractor import PDFPlumberExtractor
 from services.extractors.pdfminer_extractor import PDFMinerExtractor
 from services.extractors.extractor_combiner import ExtractorCombiner
 from services.document_analyzer import DocumentAnalyzer
-from services.confidence_scorer import ConfidenceScorer
+from services.confidence_scorer import get_scorer
 from services.validators.cross_validator import CrossValidator
 from services.field_extractor_enhanced import (
     extract_row_7a_enhanced,
@@ -42,17 +42,26 @@ class HybridFieldExtractor(FieldExtractor):
         filename = os.path.basename(filepath)
         logger.info(f"Starting hybrid extraction for {filename}")
 
-        # Step 1: Dual extraction (V2)
-        plumber = PDFPlumberExtractor()
-        pdfminer = PDFMinerExtractor()
+        # Step 1: Dual extraction (V2; PyMuPDF first when installed)
+        extractors = []
+        try:
+            from services.extractors.pymupdf_extractor import PyMuPDFExtractor
+            extractors.append(PyMuPDFExtractor())
+        except ImportError:
+            pass
+        extractors.extend([PDFPlumberExtractor(), PDFMinerExtractor()])
         combiner = ExtractorCombiner()
-        extraction = combiner.extract_with_best_method(filepath, [plumber, pdfminer])
+        # The hybrid pipeline only consumes page text, so table detection
+        # and Word materialization are skipped entirely
+        extraction = combiner.extract_with_best_method(
+            filepath, extractors, include_tables=False, include_words=False)
         logger.info(f"Selected extractor: {extraction.extractor_name}")
 
-        # Step 2: Document analysis (V2)
+        # Step 2: Document analysis (V2; one pass per page via analyze_all)
         analyzer = DocumentAnalyzer()
-        form_start_page = analyzer.detect_form_990_start(extraction.pages)
-        page_metadata = [analyzer.analyze_page(p) for p in extraction.pages]
+        report = analyzer.analyze_all(extraction.pages)
+        form_start_page = report.form_990_start
+        page_metadata = report.metadatas
         avg_ocr_quality = sum(p.ocr_quality_score for p in page_metadata) / len(page_metadata) if page_metadata else 0.5
         logger.info(f"Form 990 starts at page {form_start_page}, OCR quality: {avg_ocr_quality:.2f}")
 
@@ -89,30 +98,30 @@ class HybridFieldExtractor(FieldExtractor):
 
         # Enhance Page 1 fields (for fragmented text like 2022 PDF)
         page1_enhancements = extract_page1_enhanced(form_990_text, self)
-        if not page1_fields.total_contributions and page1_enhancements.get('total_contributions'):
+        if page1_fields.total_contributions is None and page1_enhancements.get('total_contributions'):
             page1_fields.total_contributions = page1_enhancements['total_contributions']
-        if not page1_fields.total_revenue and page1_enhancements.get('total_revenue'):
+        if page1_fields.total_revenue is None and page1_enhancements.get('total_revenue'):
             page1_fields.total_revenue = page1_enhancements['total_revenue']
-        if not page1_fields.total_assets and page1_enhancements.get('total_assets'):
+        if page1_fields.total_assets is None and page1_enhancements.get('total_assets'):
             page1_fields.total_assets = page1_enhancements['total_assets']
-        if not page1_fields.total_liabilities and page1_enhancements.get('total_liabilities'):
+        if page1_fields.total_liabilities is None and page1_enhancements.get('total_liabilities'):
             page1_fields.total_liabilities = page1_enhancements['total_liabilities']
-        if not page1_fields.net_assets_or_fund_balances and page1_enhancements.get('net_assets_or_fund_balances'):
+        if page1_fields.net_assets_or_fund_balances is None and page1_enhancements.get('net_assets_or_fund_balances'):
             page1_fields.net_assets_or_fund_balances = page1_enhancements['net_assets_or_fund_balances']
 
         # Enhance Part VIII fields
         part8_enhancements = extract_part8_enhanced(part8_section, self)
 
         # Row 7a: Gross sales (Securities vs Other) - COMMONLY MISSING
-        if not part8_fields.gross_sales_securities and part8_enhancements.get('gross_sales_securities'):
+        if part8_fields.gross_sales_securities is None and part8_enhancements.get('gross_sales_securities'):
             part8_fields.gross_sales_securities = part8_enhancements['gross_sales_securities']
-        if not part8_fields.gross_sales_other and part8_enhancements.get('gross_sales_other'):
+        if part8_fields.gross_sales_other is None and part8_enhancements.get('gross_sales_other'):
             part8_fields.gross_sales_other = part8_enhancements['gross_sales_other']
 
         # Row 12: Total revenue - Fix if it looks like a year
-        if part8_fields.total_revenue:
-            clean_rev = part8_fields.total_revenue.replace(',', '').replace('.', '')
-            if len(clean_rev) == 4 and (clean_rev.startswith('19') or clean_rev.startswith('20')):
+        if part8_fields.total_revenue is not None:
+            rev = part8_fields.total_revenue
+            if rev == rev.to_integral_value() and 1900 <= rev <= 2099:
                 # It's a year, not revenue! Replace with enhanced extraction
                 if part8_enhancements.get('total_revenue'):
                     part8_fields.total_revenue = part8_enhancements['total_revenue']
@@ -120,11 +129,11 @@ class HybridFieldExtractor(FieldExtractor):
             part8_fields.total_revenue = part8_enhancements['total_revenue']
 
         # Row 1h: Contributions total
-        if not part8_fields.contributions_total and part8_enhancements.get('contributions_total'):
+        if part8_fields.contributions_total is None and part8_enhancements.get('contributions_total'):
             part8_fields.contributions_total = part8_enhancements['contributions_total']
 
         # Row 2g: Program service revenue total
-        if not part8_fields.program_service_revenue_total and part8_enhancements.get('program_service_revenue_total'):
+        if part8_fields.program_service_revenue_total is None and part8_enhancements.get('program_service_revenue_total'):
             part8_fields.program_service_revenue_total = part8_enhancements['program_service_revenue_total']
 
         # DEBUG: Log after enhancements
@@ -136,14 +145,14 @@ class HybridFieldExtractor(FieldExtractor):
         def make_field_with_confidence(value, source="text_pattern"):
             """Convert V1 field to V2 format with confidence"""
             if value is None:
-                return FieldWithConfidence(value=None, confidence=0.0, source="none", warnings=["Field not found"])
+                return FieldWithConfidence.model_construct(value=None, confidence=0.0, source="none", warnings=["Field not found"])
 
             # Base confidence on extraction source and OCR quality
             base_confidence = 0.85 if source == "text_pattern" else 0.75
             final_confidence = base_confidence * (0.5 + (avg_ocr_quality * 0.5))
 
-            return FieldWithConfidence(
-                value=value,
+            return FieldWithConfidence.model_construct(
+                value=str(value),
                 confidence=final_confidence,
                 source=source,
                 warnings=[]
@@ -155,7 +164,7 @@ class HybridFieldExtractor(FieldExtractor):
         logger.info(f"[DEBUG PRE-V2] Net Assets: {page1_fields.net_assets_or_fund_balances}")
         logger.info(f"[DEBUG PRE-V2] Total Contributions: {page1_fields.total_contributions}")
 
-        page1_v2 = Page1FieldsV2(
+        page1_v2 = Page1FieldsV2.model_construct(
             employer_identification_number=make_field_with_confidence(page1_fields.employer_identification_number),
             gross_receipts=make_field_with_confidence(page1_fields.gross_receipts),
             total_contributions=make_field_with_confidence(page1_fields.total_contributions),
@@ -169,7 +178,7 @@ class HybridFieldExtractor(FieldExtractor):
             net_assets_or_fund_balances=make_field_with_confidence(page1_fields.net_assets_or_fund_balances),
         )
 
-        part8_v2 = PartVIIIFieldsV2(
+        part8_v2 = PartVIIIFieldsV2.model_construct(
             # Row 1: Contributions breakdown
             federated_campaigns=make_field_with_confidence(part8_fields.federated_campaigns),
             membership_dues=make_field_with_confidence(part8_fields.membership_dues),
@@ -233,7 +242,7 @@ class HybridFieldExtractor(FieldExtractor):
             total_revenue=make_field_with_confidence(part8_fields.total_revenue),
         )
 
-        part9_v2 = PartIXFieldsV2(
+        part9_v2 = PartIXFieldsV2.model_construct(
             grants_domestic_organizations=make_field_with_confidence(part9_fields.grants_domestic_organizations),
             professional_fundraising_services=make_field_with_confidence(part9_fields.professional_fundraising_services),
             affiliate_payments=make_field_with_confidence(part9_fields.affiliate_payments),
@@ -280,7 +289,7 @@ class HybridFieldExtractor(FieldExtractor):
         overall_confidence = min(1.0, v1_confidence + validation_bonus + ocr_bonus)
 
         # Build field confidences for detailed scoring
-        scorer = ConfidenceScorer()
+        scorer = get_scorer()
         field_confidences = {
             'employer_identification_number': scorer.calculate_field_confidence(
                 'employer_identification_number',
@@ -314,7 +323,7 @@ class HybridFieldExtractor(FieldExtractor):
 
         logger.info(f"Hybrid extraction complete: confidence={overall_confidence:.2f}")
 
-        return ExtractionResultV2(
+        return ExtractionResultV2.model_construct(
             filename=filename,
             page1=page1_v2,
             part_viii=part8_v2,
@@ -326,5 +335,5 @@ class HybridFieldExtractor(FieldExtractor):
             form_start_page=form_start_page,
             document_type=page_metadata[0].layout_type if page_metadata else "unknown",
             raw_text=form_990_text[:5000] if len(form_990_text) > 5000 else form_990_text,
-            errors=doc_confidence.critical_failures if overall_confidence < 0.70 else []
+            errors=doc_confidence.critical_failures_formatted if overall_confidence < 0.70 else []
         )
@@ -7,6 +7,13 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Callable
 import re
 
+# Anchored form of the monetary-amount validity rule shared with
+# field_extractor: a lone zero (surrounding commas/dots tolerated), literal
+# "0.00", or at least 4 digits with at least 3 significant ones
+_VALID_AMOUNT_RE = re.compile(
+    r'\A(?:[,.]*0[,.]*|0\.00|(?=(?:[,.]*\d){4})[0,.]*[1-9](?:[,.]*\d){2,}[,.]*)\Z'
+)
+
 
 @dataclass
 class FieldExtractionResult:
@@ -110,33 +117,11 @@ class BaseFieldExtractor(ABC):
     def _is_valid_monetary_amount(self, value: str) -> bool:
         """
         Check if value is a valid monetary amount
-        Reuses logic from existing field_extractor.py
+        Reuses logic from existing field_extractor.py; the single anchored
+        match avoids the throwaway strings the old clean/int pipeline built
+        per candidate
         """
-        if not value:
-            return False
-
-        # Clean value
-        clean = value.replace(',', '').replace('.', '')
-
-        # Explicitly allow zero
-        if clean == '0' or value == '0.00':
-            return True
-
-        if not clean.isdigit():
-            return False
-
-        # Filter small integers that look like row codes (1-99)
-        if len(clean) < 4:
-            return False
-
-        try:
-            num = int(clean)
-            if num < 100:
-                return False
-        except ValueError:
-            return False
-
-        return True
+        return bool(_VALID_AMOUNT_RE.match(value)) if value else False
 
     def _normalize_monetary_value(self, value: str) -> str:
         """Normalize monetary value format"""
@@ -82,7 +82,8 @@ class EINExtractor(BaseFieldExtractor):
     def _extract_with_spacing_fix(self, text: str) -> Optional[FieldExtractionResult]:
         """Strategy 3: Fix spacing artifacts from OCR"""
         # Pattern: "3 9 - 0 8 0 6 2 5 1" → "39-0806251"
-        spacing_pattern = r'(\d)\s+(\d)\s*-\s*(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)'
+        # [ \t] keeps the match on one line and limits backtracking on misses
+        spacing_pattern = r'(\d)[ \t]+(\d)[ \t]*-[ \t]*(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)[ \t]+(\d)'
         match = re.search(spacing_pattern, text)
         if match:
             value = f"{match.group(1)}{match.group(2)}-{match.group(3)}{match.group(4)}{match.group(5)}{match.group(6)}{match.group(7)}{match.group(8)}{match.group(9)}"
@@ -7,7 +7,7 @@ import pdfplumber
 from pdf2image import convert_from_path
 import pytesseract
 from PIL import Image, ImageEnhance, ImageFilter
-from collections import defaultdict
+import gc
 import io
 import os
 import re
@@ -160,42 +160,58 @@ class HybridPDFProcessor:
         if not words:
             return ""
 
-        # Group words by approximate y-coordinate
-        lines_by_y = defaultdict(list)
+        # One sort on (y-bucket, x0) yields the same top-to-bottom,
+        # left-to-right order the old defaultdict grouping plus two sorts
+        # produced, without allocating a dict and per-line lists
+        words.sort(key=lambda w: (round(w['top'] / y_tolerance) * y_tolerance, w['x0']))
+
+        parts = []
+        prev_key = None
         for w in words:
             y_key = round(w['top'] / y_tolerance) * y_tolerance
-            lines_by_y[y_key].append(w)
+            if prev_key is not None:
+                parts.append('\n' if y_key != prev_key else ' ')
+            parts.append(w['text'])
+            prev_key = y_key
 
-        # Build text lines sorted by y, words sorted by x within each line
-        text_lines = []
-        for y in sorted(lines_by_y.keys()):
-            line_words = sorted(lines_by_y[y], key=lambda w: w['x0'])
-            line = ' '.join(w['text'] for w in line_words)
-            text_lines.append(line)
+        return ''.join(parts)
 
-        return '\n'.join(text_lines)
+    # Pages are processed in batches of this size so pdfminer's per-page
+    # character objects can be released between batches instead of
+    # accumulating for the whole document (large PDFs OOM otherwise)
+    PDFPLUMBER_BATCH_SIZE = 25
 
     def _extract_with_pdfplumber(self, filepath: str) -> Tuple[str, List[dict]]:
         """Extract text using pdfplumber with word-level y-tolerance grouping"""
-        full_text = ""
+        full_text_parts = []
         pages_data = []
 
         with pdfplumber.open(filepath) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                page_text = self._extract_words_to_text(page, y_tolerance=3)
-                tables = page.extract_tables() or []
+            num_pages = len(pdf.pages)
 
-                page_data = {
-                    "page_number": page_num,
-                    "text": page_text,
-                    "tables": tables,
-                    "width": page.width,
-                    "height": page.height,
-                }
-                pages_data.append(page_data)
-                full_text += f"\n--- Page {page_num} ---\n{page_text}\n"
+        for chunk_start in range(0, num_pages, self.PDFPLUMBER_BATCH_SIZE):
+            chunk_end = min(chunk_start + self.PDFPLUMBER_BATCH_SIZE, num_pages)
+            chunk_page_nums = list(range(chunk_start + 1, chunk_end + 1))
 
-        return full_text, pages_data
+            with pdfplumber.open(filepath, pages=chunk_page_nums) as pdf:
+                for page_num, page in zip(chunk_page_nums, pdf.pages):
+                    page_text = self._extract_words_to_text(page, y_tolerance=3)
+                    tables = page.extract_tables() or []
+
+                    pages_data.append({
+                        "page_number": page_num,
+                        "text": page_text,
+                        "tables": tables,
+                        "width": page.width,
+                        "height": page.height,
+                    })
+                    full_text_parts.append(f"\n--- Page {page_num} ---\n{page_text}\n")
+                    page.flush_cache()
+
+            # Drop the batch's layout objects before opening the next one
+            gc.collect()
+
+        return ''.join(full_text_parts), pages_data
     
     def _extract_with_full_ocr(self, filepath: str) -> Tuple[str, List[dict]]:
         """
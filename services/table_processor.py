@@ -7,6 +7,8 @@ import logging
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 
+from config.extraction_config import EXTRACTION_CONFIG, apply_header_fixes
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,22 +38,13 @@ class TableProcessor:
     Handles OCR artifacts and formatting differences
     """
 
-    # OCR artifact patterns to clean
-    ARTIFACT_PATTERNS = [
-        (r'<ti \(/1', ''),
-        (r'C c,J :C', ''),
-        (r'\.{5,}', ''),  # Multiple dots (dot leaders)
-        (r'~{5,}', ''),   # Multiple tildes
-        (r'[<>(){}/\\]{3,}', ''),  # Multiple special chars
-    ]
+    # OCR artifact patterns fused into one alternation (precompiled at config import)
+    ARTIFACT_PATTERN = EXTRACTION_CONFIG["table_normalization"]["artifact_pattern_combined"]
 
-    # Spacing fix patterns
-    SPACING_PATTERNS = [
-        # Fix EIN spacing: "3 9 - 0 8 0 6 2 5 1" → "39-0806251"
-        (r'(\d)\s+(\d)\s*-\s*(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)\s+(\d)',
-         r'\1\2-\3\4\5\6\7\8\9'),
+    # Spacing fix patterns (precompiled pattern, replacement)
+    SPACING_PATTERNS = EXTRACTION_CONFIG["table_normalization"]["spacing_fix_patterns_compiled"] + [
         # Fix general digit spacing: "1 2 3 4" → "1234"
-        (r'(\d)\s+(\d)\s+(\d)', r'\1\2\3'),
+        (re.compile(r'(\d)\s+(\d)\s+(\d)'), r'\1\2\3'),
     ]
 
     # Column header patterns
@@ -79,7 +72,9 @@ class TableProcessor:
         else:
             raw_cells = table
 
-        if not raw_cells:
+        # len() rather than truthiness: cells may be an ndarray, where bool()
+        # on a multi-element array raises
+        if raw_cells is None or len(raw_cells) == 0:
             return NormalizedTable([], [], "unknown", 0.0, page_number)
 
         # Clean all cells
@@ -124,13 +119,12 @@ class TableProcessor:
 
         cleaned = text
 
-        # Apply artifact removal patterns
-        for pattern, replacement in self.ARTIFACT_PATTERNS:
-            cleaned = re.sub(pattern, replacement, cleaned)
+        # Remove OCR artifacts in a single pass
+        cleaned = self.ARTIFACT_PATTERN.sub('', cleaned)
 
         # Apply spacing fixes
         for pattern, replacement in self.SPACING_PATTERNS:
-            cleaned = re.sub(pattern, replacement, cleaned)
+            cleaned = pattern.sub(replacement, cleaned)
 
         # Fix common OCR typos
         cleaned = self._fix_ocr_typos(cleaned)
@@ -145,9 +139,8 @@ class TableProcessor:
 
     def _fix_ocr_typos(self, text: str) -> str:
         """Fix common OCR typos"""
-        # Fix column label typos
-        text = re.sub(r'\(Cl\)', '(C)', text)  # "(Cl)" → "(C)"
-        text = re.sub(r'ia-1f', '1a-1f', text)  # "ia-1f" → "1a-1f"
+        # Fix column label typos (configured header_fixes, applied in one pass)
+        text = apply_header_fixes(text)
 
         # Fix common letter/number confusion
         text = re.sub(r'\bl\b', '1', text)  # standalone "l" → "1"
@@ -3,6 +3,7 @@ Cross-Field Validation
 Validates consistency across related fields in Form 990
 """
 from dataclasses import dataclass
+from decimal import Decimal
 from typing import Optional, List, Dict, Any
 import logging
 
@@ -237,8 +238,15 @@ class CrossValidator:
 
         return None
 
-    def _parse_number(self, value: str) -> Optional[float]:
+    def _parse_number(self, value: Any) -> Optional[float]:
         """Parse monetary value to float"""
+        if value is None:
+            return None
+
+        # Models now store monetary fields numerically (Decimal); no reparsing needed
+        if isinstance(value, (int, float, Decimal)):
+            return float(value)
+
         if not value:
             return None
 